@@ -13,8 +13,10 @@ explicit freshness factor derived from source ages / article update times.
 
 from __future__ import annotations
 
+import heapq
 import math
 import re
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
@@ -98,6 +100,27 @@ def detect_query_intent(query: str) -> str:
     return "general"
 
 
+# ---------------------------------------------------------------------------
+# Timestamp parsing
+# ---------------------------------------------------------------------------
+
+
+def _to_epoch(value: datetime | str | None) -> float | None:
+    """Return epoch seconds for a datetime or ISO string (naive values are UTC), or None if unusable."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
 # ---------------------------------------------------------------------------
 # Cold-start helpers (#71)
 # ---------------------------------------------------------------------------
@@ -108,30 +131,22 @@ _COLD_START_FLOOR_HALF = 0.15  # floor at 24h -> 48h
 _COLD_START_MIN_CONFIDENCE = 0.7
 
 
-def _cold_start_floor(article: dict, confidence: float) -> float | None:
+def _cold_start_floor(article: dict, confidence: float, now: float | None = None) -> float | None:
     """Return the cold-start score floor for a qualifying article, or None."""
     if confidence < _COLD_START_MIN_CONFIDENCE:
         return None
 
-    created_at = article.get("created_at")
-    if created_at is None:
+    created_epoch = _to_epoch(article.get("created_at"))
+    if created_epoch is None:
         return None
 
-    if isinstance(created_at, str):
-        try:
-            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            return None
-
-    if isinstance(created_at, datetime):
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=UTC)
-        now = datetime.now(UTC)
-        age_hours = (now - created_at).total_seconds() / 3600.0
-        if age_hours <= 24:
-            return _COLD_START_FLOOR_FULL
-        elif age_hours <= 48:
-            return _COLD_START_FLOOR_HALF
+    if now is None:
+        now = time.time()
+    age_hours = (now - created_epoch) / 3600.0
+    if age_hours <= 24:
+        return _COLD_START_FLOOR_FULL
+    elif age_hours <= 48:
+        return _COLD_START_FLOOR_HALF
 
     return None
 
@@ -141,7 +156,8 @@ def compute_confidence_score(article: dict) -> float:
 
     Works with both article dicts (v2) and legacy belief dicts (v1).
     Uses geometric mean to penalize articles with any weak dimension.
-    Falls back to JSONB 'overall' field for backward compatibility.
+    Falls back to JSONB 'overall' field for backward compatibility,
+    including when a 6D dimension is non-numeric, negative, or non-finite.
 
     Args:
         article: Article (or legacy belief) dict from the database.
@@ -155,21 +171,19 @@ def compute_confidence_score(article: dict) -> float:
     corr = belief.get("confidence_corroboration", 0.1)
     app = belief.get("confidence_applicability", 0.8)
 
-    has_6d = any(
-        [
-            belief.get("confidence_source") is not None,
-            belief.get("confidence_method") is not None,
-        ]
-    )
+    has_6d = belief.get("confidence_source") is not None or belief.get("confidence_method") is not None
 
     if has_6d:
-        # Geometric mean with spec weights
-        # w_sr=0.25, w_mq=0.20, w_ic=0.15, w_tf=0.15, w_cor=0.15, w_da=0.10
+        # The sum is finite only if every dimension is; min() rejects negatives
         try:
+            valid = math.isfinite(src + meth + cons + fresh + corr + app) and min(src, meth, cons, fresh, corr, app) >= 0.0
+        except TypeError:
+            valid = False
+        if valid:
+            # Geometric mean with spec weights
+            # w_sr=0.25, w_mq=0.20, w_ic=0.15, w_tf=0.15, w_cor=0.15, w_da=0.10
             score = (src**0.25) * (meth**0.20) * (cons**0.15) * (fresh**0.15) * (corr**0.15) * (app**0.10)
             return min(1.0, max(0.0, score))
-        except (ValueError, ZeroDivisionError):
-            pass
 
     # Fallback to JSONB overall
     conf = belief.get("confidence", {})
@@ -181,27 +195,24 @@ def compute_confidence_score(article: dict) -> float:
     return 0.5
 
 
-def compute_recency_score(created_at: datetime | str | None, decay_rate: float = 0.01) -> float:
+def compute_recency_score(
+    created_at: datetime | str | None,
+    decay_rate: float = 0.01,
+    now: float | None = None,
+) -> float:
     """Compute recency score with exponential decay.
 
     Default decay_rate=0.01 gives a half-life of ~69 days.
     Handles datetime objects, ISO format strings, and None.
+    ``now`` (epoch seconds) lets batch callers share one clock reading.
     """
-    if not created_at:
+    created_epoch = _to_epoch(created_at)
+    if created_epoch is None:
         return 0.5
 
-    # Handle string dates (from serialized data)
-    if isinstance(created_at, str):
-        try:
-            created_at = datetime.fromisoformat(created_at)
-        except (ValueError, TypeError):
-            return 0.5
-
-    if created_at.tzinfo is None:
-        created_at = created_at.replace(tzinfo=UTC)
-
-    now = datetime.now(UTC)
-    age_days = (now - created_at).total_seconds() / 86400
+    if now is None:
+        now = time.time()
+    age_days = (now - created_epoch) / 86400
 
     recency = math.exp(-decay_rate * age_days)
     return min(1.0, max(0.0, recency))
@@ -232,6 +243,35 @@ def compute_freshness_score(
     return 0.5  # Unknown age
 
 
+def _final_score(result: dict) -> float:
+    """Sort key for ranked results."""
+    return result.get("final_score", 0)
+
+
+_SIGNAL_NAMES = ("semantic", "confidence", "recency")
+
+
+def _score_breakdown(
+    values: tuple[float, float, float],
+    weights: tuple[float, float, float],
+    final_score: float,
+) -> dict:
+    """Build the explain-mode ``score_breakdown`` for one ranked result."""
+    breakdown: dict = {
+        name: {"value": value, "weight": weight, "contribution": weight * value}
+        for name, value, weight in zip(_SIGNAL_NAMES, values, weights, strict=True)
+    }
+    breakdown["final"] = final_score
+    return breakdown
+
+
+# Use heapq.nlargest only when len(ranked) exceeds limit by more than this factor.
+_HEAP_SELECT_FACTOR = 4
+
+# Normalized weights at or below this magnitude contribute nothing measurable to final_score.
+_NEGLIGIBLE_WEIGHT = 1e-9
+
+
 def multi_signal_rank(
     results: list[dict],
     semantic_weight: float = 0.50,
@@ -242,6 +282,7 @@ def multi_signal_rank(
     explain: bool = False,
     query_intent: str | None = None,
     cold_start_boost: bool = True,
+    limit: int | None = None,
 ) -> list[dict]:
     """Apply multi-signal ranking to query results.
 
@@ -265,6 +306,8 @@ def multi_signal_rank(
             "general" intent or "semantic" epistemic_type -> no adjustment.
         cold_start_boost: When True, apply a score floor to fresh high-confidence articles
             to prevent cold-start burial (default True).
+        limit: Return only the top ``limit`` results (optional). Limits far below
+            the result count use a bounded heap instead of a full sort.
 
     Returns:
         Sorted results with 'final_score' and optional 'score_breakdown'.
@@ -276,8 +319,23 @@ def multi_signal_rank(
         confidence_weight /= total_weight
         recency_weight /= total_weight
 
+    # Skip signals whose normalized weight is negligible (e.g. a 1.0/0/0
+    # profile): they cannot move any score, so computing them is wasted work.
+    # Confidence is still needed when it drives filtering or the cold-start floor.
+    score_confidence = explain or abs(confidence_weight) > _NEGLIGIBLE_WEIGHT or min_confidence is not None or cold_start_boost
+    score_recency = explain or abs(recency_weight) > _NEGLIGIBLE_WEIGHT
+
+    now = time.time()
+    signals: dict[int, tuple[float, float, float]] = {}
     ranked = []
     for r in results:
+        # Confidence score
+        confidence = compute_confidence_score(r) if score_confidence else 0.0
+
+        # Filter by minimum confidence before any other per-row scoring
+        if min_confidence is not None and confidence < min_confidence:
+            continue
+
         # Semantic score (already computed from embedding similarity or ts_rank)
         semantic = r.get("similarity", 0.0)
         if isinstance(semantic, int | float):
@@ -285,16 +343,14 @@ def multi_signal_rank(
         else:
             semantic = 0.0
 
-        # Confidence score
-        confidence = compute_confidence_score(r)
-
-        # Filter by minimum confidence if specified
-        if min_confidence is not None and confidence < min_confidence:
-            continue
-
         # Freshness / recency score — prefer compiled_at (articles) over created_at
         freshness_ts = r.get("compiled_at") or r.get("modified_at") or r.get("created_at")
-        recency = compute_recency_score(freshness_ts, decay_rate) if freshness_ts else 0.5
+        if not score_recency:
+            recency = 0.0
+        elif not freshness_ts:
+            recency = 0.5
+        else:
+            recency = compute_recency_score(freshness_ts, decay_rate, now)
 
         # Final score
         final_score = semantic_weight * semantic + confidence_weight * confidence + recency_weight * recency
@@ -310,34 +366,29 @@ def multi_signal_rank(
 
         # --- Cold-start boost (#71) ---
         if cold_start_boost:
-            floor = _cold_start_floor(r, confidence)
+            floor = _cold_start_floor(r, confidence, now)
             if floor is not None:
                 final_score = max(final_score, floor)
 
         r["final_score"] = final_score
 
         if explain:
-            r["score_breakdown"] = {
-                "semantic": {
-                    "value": semantic,
-                    "weight": semantic_weight,
-                    "contribution": semantic_weight * semantic,
-                },
-                "confidence": {
-                    "value": confidence,
-                    "weight": confidence_weight,
-                    "contribution": confidence_weight * confidence,
-                },
-                "recency": {
-                    "value": recency,
-                    "weight": recency_weight,
-                    "contribution": recency_weight * recency,
-                },
-                "final": final_score,
-            }
+            signals[id(r)] = (semantic, confidence, recency)
 
         ranked.append(r)
 
-    ranked.sort(key=lambda x: x.get("final_score", 0), reverse=True)
+    # A bounded heap only beats sort-and-slice when the limit is far below n
+    if limit is not None and limit * _HEAP_SELECT_FACTOR < len(ranked):
+        ranked = heapq.nlargest(limit, ranked, key=_final_score)
+    else:
+        ranked.sort(key=_final_score, reverse=True)
+        if limit is not None:
+            ranked = ranked[: max(limit, 0)]
+
+    # Breakdowns are built only for the rows actually returned
+    if explain:
+        weights = (semantic_weight, confidence_weight, recency_weight)
+        for r in ranked:
+            r["score_breakdown"] = _score_breakdown(signals[id(r)], weights, r["final_score"])
 
     return ranked
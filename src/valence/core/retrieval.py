@@ -598,6 +598,7 @@ def _retrieve_sync(
         confidence_weight=weights["confidence"],
         recency_weight=weights["recency"],
         query_intent=query_intent,
+        limit=limit,
     )
 
     # Restore original created_at
@@ -606,8 +607,6 @@ def _retrieve_sync(
         if orig is not None:
             r["created_at"] = orig
 
-    ranked = ranked[:limit]
-
     # Apply rank floor to archived articles
     for r in ranked:
         if r.get("status") == "archived" and r.get("final_score", 0) > ARCHIVED_RANK_FLOOR:
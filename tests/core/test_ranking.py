@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 from valence.core.ranking import (
     RankingConfig,
@@ -12,6 +13,8 @@ from valence.core.ranking import (
     multi_signal_rank,
 )
 
+_NOW = datetime.now(UTC)
+
 
 class TestRankingConfig:
     """Tests for RankingConfig dataclass."""
@@ -41,6 +44,18 @@ class TestRankingConfig:
         normed = config.normalized()
         assert normed.semantic_weight == 0.50
 
+    def test_rank_normalizes_weights(self):
+        """multi_signal_rank should report the normalized weights in its breakdown."""
+        ranked = multi_signal_rank(
+            [{"similarity": 0.5, "confidence": {"overall": 0.5}}],
+            semantic_weight=2.0,
+            confidence_weight=1.0,
+            recency_weight=1.0,
+            explain=True,
+        )
+        breakdown = ranked[0]["score_breakdown"]
+        assert [breakdown[k]["weight"] for k in ("semantic", "confidence", "recency")] == [0.5, 0.25, 0.25]
+
 
 class TestComputeConfidenceScore:
     """Tests for compute_confidence_score."""
@@ -84,26 +99,39 @@ class TestComputeConfidenceScore:
         score = compute_confidence_score(belief)
         assert abs(score - 0.5) < 1e-10
 
+    def test_invalid_6d_values_fall_back_to_overall(self):
+        """Non-numeric, negative, NaN, or infinite 6D values should use the JSONB overall."""
+        articles = [
+            {"confidence_source": -0.2, "confidence": {"overall": 0.7}},
+            {"confidence_source": "bad", "confidence": {"overall": 0.6}},
+            {"confidence_source": 0.8, "confidence_corroboration": None, "confidence": {"overall": 0.4}},
+            {"confidence_method": float("nan"), "confidence": {"overall": 0.3}},
+            {"confidence_source": float("inf"), "confidence_method": 0.0, "confidence": {"overall": 0.2}},
+        ]
+        assert [compute_confidence_score(a) for a in articles] == [0.7, 0.6, 0.4, 0.3, 0.2]
+
+    def test_zero_dimension_scores_zero(self):
+        assert compute_confidence_score({"confidence_method": 0.0}) == 0.0
+
 
 class TestComputeRecencyScore:
     """Tests for compute_recency_score."""
 
     def test_recent_scores_high(self):
         """A just-created belief should score near 1.0."""
-        now = datetime.now(UTC)
-        score = compute_recency_score(now)
+        score = compute_recency_score(_NOW)
         assert score > 0.99
 
     def test_old_scores_low(self):
         """A very old belief should score near 0."""
-        old = datetime.now(UTC) - timedelta(days=1000)
+        old = _NOW - timedelta(days=1000)
         score = compute_recency_score(old)
         assert score < 0.01
 
     def test_half_life(self):
         """Score at ~69 days should be approximately 0.5 with default decay."""
         half_life = math.log(2) / 0.01  # ~69.3 days
-        dt = datetime.now(UTC) - timedelta(days=half_life)
+        dt = _NOW - timedelta(days=half_life)
         score = compute_recency_score(dt)
         assert abs(score - 0.5) < 0.02
 
@@ -120,11 +148,23 @@ class TestComputeRecencyScore:
 
     def test_custom_decay_rate(self):
         """Custom decay rate should change the half-life."""
-        dt = datetime.now(UTC) - timedelta(days=10)
+        dt = _NOW - timedelta(days=10)
         fast = compute_recency_score(dt, decay_rate=0.1)
         slow = compute_recency_score(dt, decay_rate=0.001)
         assert fast < slow  # Faster decay = lower score at same age
 
+    def test_exact_exponential_decay(self):
+        """Scores should match exp(-rate * age) exactly, including for steep rates."""
+        now = _NOW.timestamp()
+        for rate in (0.01, 0.5, 1.0):
+            for days in (0.5, 3.25, 69.3):
+                score = compute_recency_score(_NOW - timedelta(days=days), decay_rate=rate, now=now)
+                assert math.isclose(score, math.exp(-rate * days), rel_tol=1e-9)
+
+    def test_naive_iso_string_treated_as_utc(self):
+        naive = (_NOW - timedelta(days=10)).replace(tzinfo=None).isoformat()
+        assert abs(compute_recency_score(naive) - math.exp(-0.1)) < 1e-3
+
 
 class TestMultiSignalRank:
     """Tests for multi_signal_rank."""
@@ -133,7 +173,7 @@ class TestMultiSignalRank:
         return {
             "similarity": similarity,
             "confidence": {"overall": confidence_overall},
-            "created_at": datetime.now(UTC) - timedelta(days=days_ago),
+            "created_at": _NOW - timedelta(days=days_ago),
         }
 
     def test_sort_by_final_score(self):
@@ -182,6 +222,33 @@ class TestMultiSignalRank:
         for r in ranked:
             assert r["confidence"]["overall"] >= 0.5
 
+    def test_min_confidence_filters_before_scoring(self):
+        """Rows dropped by min_confidence should never reach recency scoring."""
+        results = [self._make_belief(confidence_overall=0.2), self._make_belief(confidence_overall=0.9)]
+        with patch("valence.core.ranking.compute_recency_score", return_value=1.0) as mock_recency:
+            ranked = multi_signal_rank(results, min_confidence=0.5, explain=True)
+        assert mock_recency.call_count == 1
+        assert len(ranked) == 1
+        assert "score_breakdown" not in results[0]
+
+    def test_limit_returns_top_results(self):
+        """limit should return the same prefix as a full sort."""
+        results = [self._make_belief(similarity=i / 20) for i in range(20)]
+        full = [r["similarity"] for r in multi_signal_rank([r.copy() for r in results])]
+        top = multi_signal_rank([r.copy() for r in results], limit=3)
+        assert [r["similarity"] for r in top] == full[:3]
+
+    def test_limit_near_result_count_slices(self):
+        """Limits close to n take the sort-and-slice path with the same result."""
+        results = [self._make_belief(similarity=i / 10) for i in range(10)]
+        ranked = multi_signal_rank(results, limit=6)
+        assert [r["similarity"] for r in ranked] == [0.9, 0.8, 0.7, 0.6, 0.5, 0.4]
+
+    def test_limit_larger_than_results(self):
+        results = [self._make_belief(similarity=0.2), self._make_belief(similarity=0.7)]
+        ranked = multi_signal_rank(results, limit=10)
+        assert [r["similarity"] for r in ranked] == [0.7, 0.2]
+
     def test_explain_mode(self):
         """explain=True should include score_breakdown."""
         results = [self._make_belief()]
@@ -196,6 +263,14 @@ class TestMultiSignalRank:
         total = sum(breakdown[k]["contribution"] for k in ("semantic", "confidence", "recency"))
         assert abs(total - breakdown["final"]) < 1e-10
 
+    def test_explain_with_limit_only_breaks_down_returned(self):
+        """Rows cut by limit should not get a score_breakdown."""
+        results = [self._make_belief(similarity=0.1), self._make_belief(similarity=0.9)]
+        ranked = multi_signal_rank(results, explain=True, limit=1)
+        assert ranked[0]["similarity"] == 0.9
+        assert ranked[0]["score_breakdown"]["final"] == ranked[0]["final_score"]
+        assert "score_breakdown" not in results[0]
+
     def test_explain_false_no_breakdown(self):
         """explain=False should not include score_breakdown."""
         results = [self._make_belief()]
@@ -214,8 +289,27 @@ class TestMultiSignalRank:
         ranked = multi_signal_rank([])
         assert ranked == []
 
+    def test_zero_weight_signals_skipped(self):
+        """A pure-semantic profile should rank by similarity without scoring recency."""
+        results = [self._make_belief(similarity=0.3, days_ago=0), self._make_belief(similarity=0.8, days_ago=500)]
+        with patch("valence.core.ranking.compute_recency_score") as mock_recency:
+            ranked = multi_signal_rank(results, semantic_weight=1.0, confidence_weight=0.0, recency_weight=0.0, cold_start_boost=False)
+        mock_recency.assert_not_called()
+        assert [r["similarity"] for r in ranked] == [0.8, 0.3]
+        assert ranked[0]["final_score"] == 0.8
+
+    def test_negative_weight_not_skipped(self):
+        """Weights summing to <= 0 stay unnormalized; a negative weight must still apply."""
+        results = [
+            {"similarity": 0.9, "confidence": {"overall": 0.9}},
+            {"similarity": 0.8, "confidence": {"overall": 0.1}},
+        ]
+        ranked = multi_signal_rank(results, semantic_weight=1.0, confidence_weight=-1.0, recency_weight=0.0, cold_start_boost=False)
+        assert [r["similarity"] for r in ranked] == [0.8, 0.9]
+        assert abs(ranked[0]["final_score"] - 0.7) < 1e-9
+
     def test_missing_similarity_defaults_zero(self):
         """Beliefs without 'similarity' key should get 0.0 semantic score."""
-        results = [{"confidence": {"overall": 0.8}, "created_at": datetime.now(UTC)}]
+        results = [{"confidence": {"overall": 0.8}, "created_at": _NOW}]
         ranked = multi_signal_rank(results, explain=True)
         assert ranked[0]["score_breakdown"]["semantic"]["value"] == 0.0
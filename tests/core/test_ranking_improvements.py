@@ -7,10 +7,10 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
-import pytest
-
 from valence.core.ranking import detect_query_intent, multi_signal_rank
 
+_NOW = datetime.now(UTC)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -26,7 +26,7 @@ def make_article(
 ) -> dict:
     """Build a minimal article dict for ranking tests."""
     if created_at is None:
-        created_at = (datetime.now(UTC) - timedelta(days=365)).isoformat()
+        created_at = (_NOW - timedelta(days=365)).isoformat()
     elif isinstance(created_at, datetime):
         created_at = created_at.isoformat()
     return {
@@ -160,7 +160,7 @@ class TestColdStartBoost:
         fresh = make_article(
             similarity=0.0,  # very low semantic match
             confidence=0.8,
-            created_at=datetime.now(UTC) - timedelta(hours=1),
+            created_at=_NOW - timedelta(hours=1),
         )
         results = multi_signal_rank([fresh], cold_start_boost=True)
         assert results[0]["final_score"] >= 0.3
@@ -172,12 +172,12 @@ class TestColdStartBoost:
         article_36h = make_article(
             similarity=0.0,
             confidence=0.7,  # just above threshold
-            created_at=datetime.now(UTC) - timedelta(hours=36),
+            created_at=_NOW - timedelta(hours=36),
         )
         article_2h = make_article(
             similarity=0.0,
             confidence=0.7,
-            created_at=datetime.now(UTC) - timedelta(hours=2),
+            created_at=_NOW - timedelta(hours=2),
         )
         results_36h = multi_signal_rank([article_36h], cold_start_boost=True)
         results_2h = multi_signal_rank([article_2h], cold_start_boost=True)
@@ -196,12 +196,12 @@ class TestColdStartBoost:
         fresh_article = make_article(
             similarity=0.0,
             confidence=0.75,
-            created_at=datetime.now(UTC) - timedelta(hours=2),
+            created_at=_NOW - timedelta(hours=2),
         )
         old_article = make_article(
             similarity=0.0,
             confidence=0.75,
-            created_at=datetime.now(UTC) - timedelta(hours=72),
+            created_at=_NOW - timedelta(hours=72),
         )
         results_fresh = multi_signal_rank([fresh_article], cold_start_boost=True)
         results_old = multi_signal_rank([old_article], cold_start_boost=True)
@@ -216,12 +216,12 @@ class TestColdStartBoost:
         fresh_low_conf = make_article(
             similarity=0.0,
             confidence=0.5,  # below threshold
-            created_at=datetime.now(UTC) - timedelta(hours=1),
+            created_at=_NOW - timedelta(hours=1),
         )
         fresh_high_conf = make_article(
             similarity=0.0,
             confidence=0.8,  # above threshold
-            created_at=datetime.now(UTC) - timedelta(hours=1),
+            created_at=_NOW - timedelta(hours=1),
         )
         results_low = multi_signal_rank([fresh_low_conf], cold_start_boost=True)
         results_high = multi_signal_rank([fresh_high_conf], cold_start_boost=True)
@@ -243,8 +243,8 @@ class TestColdStartBoost:
                 "similarity": 0.0,
                 "confidence": {"overall": 0.7},
                 "epistemic_type": None,
-                "created_at": (datetime.now(UTC) - timedelta(hours=1)).isoformat(),
-                "compiled_at": (datetime.now(UTC) - timedelta(days=365)).isoformat(),
+                "created_at": (_NOW - timedelta(hours=1)).isoformat(),
+                "compiled_at": (_NOW - timedelta(days=365)).isoformat(),
             }
 
         results_on = multi_signal_rank([_make()], cold_start_boost=True)
@@ -259,7 +259,7 @@ class TestColdStartBoost:
         fresh_high = make_article(
             similarity=0.9,
             confidence=0.9,
-            created_at=datetime.now(UTC) - timedelta(hours=1),
+            created_at=_NOW - timedelta(hours=1),
         )
         results = multi_signal_rank([fresh_high], cold_start_boost=True)
         # Score should be well above 0.3
@@ -278,13 +278,13 @@ class TestCombined:
             similarity=0.5,
             confidence=0.8,
             epistemic_type="procedural",
-            created_at=datetime.now(UTC) - timedelta(hours=2),
+            created_at=_NOW - timedelta(hours=2),
         )
         old_episodic = make_article(
             similarity=0.6,  # slightly higher semantic match
             confidence=0.9,
             epistemic_type="episodic",
-            created_at=datetime.now(UTC) - timedelta(days=180),
+            created_at=_NOW - timedelta(days=180),
         )
         results = multi_signal_rank(
             [old_episodic, fresh_procedural],